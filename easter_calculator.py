@@ -1,28 +1,64 @@
 from skyfield.api import load
+from skyfield.timelib import Time
+from skyfield.framelib import ecliptic_frame
+from skyfield.functions import mxv
 from scipy.optimize import brentq
 import numpy as np
 import datetime
+import functools
+
+_MONTHS = ("January", "February", "March", "April", "May", "June", "July",
+           "August", "September", "October", "November", "December")
+
+SUN_ABERRATION_DEG = 20.4898 / 3600  # annual aberration of the Sun in longitude
+
+# Root-finding tolerance in days (about 1 ms), used by every solver. The model
+# error is far larger: the Meeus series, and the geometric positions with a
+# constant aberration, put full moons a few seconds (3-5 s in tests) from the
+# apparent ephemeris result. The tolerance just keeps the solvers out of that budget
+ROOT_TOL_DAYS = 1e-8
+
+_TS = None
+
+def get_timescale():
+    """Returns the shared Skyfield timescale, loading it on first use."""
+    global _TS
+    if _TS is None:
+        _TS = load.timescale()
+    return _TS
+
+@functools.lru_cache(maxsize=2)
+def get_ephemeris(filename):
+    """Load the ephemeris file only once; later calls reuse the opened kernel."""
+    return load(filename)
+
+def in_de440_years(year):
+    """True for 1549 <= year <= 2650, the years covered by de440.bsp.
+       year may also be a NumPy array, in which case a boolean array is returned."""
+    return (year >= 1549) & (year <= 2650)
 
 def load_ephemeris_for_year(year):
     """Load de440.bsp for 1549 <= year <= 2650, otherwise load de406.bsp."""
-    if 1549 <= year <= 2650:
-        eph = load('de440.bsp')
+    if in_de440_years(year):
+        eph = get_ephemeris('de440.bsp')
     else:
-        eph = load('de406.bsp')
+        eph = get_ephemeris('de406.bsp')
     return eph
 
-def vernal_equinox(ts, eph, year):
-    """Returns a Skyfield Time Object with the instant of the vernal equinox for year"""
+def vernal_equinox(year, ts=None, eph=None):
+    """Returns a Skyfield Time Object with the instant of the vernal equinox for year.
+       ts and eph default to the shared timescale and the ephemeris covering year."""
+    if ts is None:
+        ts = get_timescale()
+    if eph is None:
+        eph = load_ephemeris_for_year(year)
     earth = eph['earth']
     sun = eph['sun']
 
-    # Define a function returning Sun's apparent ecliptic longitude minus 0°
-    def sun_longitude_minus_zero(jd):
+    def apparent_sun_longitude(jd):
         t = ts.tt(jd=jd)
         astrometric = earth.at(t).observe(sun).apparent()
-        lon = astrometric.ecliptic_latlon(epoch='date')[1]
-        # Wrap to [-180, 180) for robust root-finding
-        return ((lon.degrees + 180) % 360) - 180
+        return astrometric.ecliptic_latlon(epoch='date')[1].degrees
 
     # Estimate: Vernal equinox occurs around March 20
     t0 = ts.utc(year, 3, 18)
@@ -30,92 +66,271 @@ def vernal_equinox(ts, eph, year):
     jd0 = t0.tt
     jd1 = t1.tt
 
+    # Sample the Sun once across the bracket; root-finding then runs on the fit
+    sun_longitude = _longitude_fit(apparent_sun_longitude, jd0, jd1)
+
+    # Define a function returning Sun's apparent ecliptic longitude minus 0°.
+    # brentq calls it repeatedly, so the fit is bound as a default (a fast local)
+    def sun_longitude_minus_zero(jd, _fit=sun_longitude):
+        # Wrap to [-180, 180) for robust root-finding
+        return ((_fit(jd) + 180) % 360) - 180
+
     # Root-finding to solve sun_longitude_minus_zero(jd) == 0
-    eq_jd = brentq(sun_longitude_minus_zero, jd0, jd1)
+    eq_jd = brentq(sun_longitude_minus_zero, jd0, jd1, xtol=ROOT_TOL_DAYS)
     eq_time = ts.tt(jd=eq_jd)
 
     # Return as a Skyfield Time object (can use eq_time.utc_datetime(), eq_time.utc_iso(), etc.)
     return eq_time
 
-def elongation_from_sun(ts, eph, jd):
-    """Returns the Elongation of the moon from the sun in degrees at given Julian date jd."""
+def elongation_from_sun(jd, ts=None, eph=None):
+    """Returns the Elongation of the moon from the sun in degrees at given Julian date jd.
+       jd may also be a NumPy array, in which case an array of elongations is returned.
+       ts and eph default to the shared timescale and the ephemeris covering jd
+       (for an array, the ephemeris covering its earliest date)."""
+    if ts is None:
+        ts = get_timescale()
     t = ts.tt(jd=jd)
-    earth = eph['earth']
-    sun = eph['sun']
-    moon = eph['moon']
-    astrometric_sun = earth.at(t).observe(sun).apparent()
-    astrometric_moon = earth.at(t).observe(moon).apparent()
-
-    # Use ecliptic longitude in true equinox of date
-    sun_lon = astrometric_sun.ecliptic_latlon(epoch='date')[1].degrees
-    moon_lon = astrometric_moon.ecliptic_latlon(epoch='date')[1].degrees
+    if eph is None:
+        eph = load_ephemeris_for_year(int(np.min(t.tt_calendar()[0])))
+    # Compute the Earth's position once and measure both bodies from it
+    earth_position = eph['earth'].at(t)
+    rotation = _ecliptic_rotation(earth_position)
+    sun_lon = _sun_longitude(earth_position, eph['sun'], rotation)
+    moon_lon = _moon_longitude(earth_position, eph['moon'], rotation)
 
     elong = (moon_lon - sun_lon) % 360
     return elong
 
-def get_first_full_moon_after(ts, eph, time_after, window_days=30):
+# Use geometric positions instead of observe().apparent() for the elongation:
+# the light-time iteration is the expensive part, and for the Moon it changes
+# the longitude by well under an arcsecond.
+# Longitudes are measured in the ecliptic of date. Its rotation holds the
+# precession and nutation models, so it is computed once per t and shared by
+# the Sun and the Moon.
+
+def _ecliptic_rotation(earth_position):
+    """Rotation from ICRF into the ecliptic of date at earth_position.t."""
+    return ecliptic_frame.rotation_at(earth_position.t)
+
+def _ecliptic_longitude(position, rotation):
+    """Ecliptic longitude in degrees of an ICRF position, given the rotation
+       returned by _ecliptic_rotation."""
+    x, y, _ = mxv(rotation, position.position.au)
+    return np.degrees(np.arctan2(y, x)) % 360
+
+def _sun_longitude(earth_position, sun, rotation=None):
+    """Sun's ecliptic longitude (of date) as used for the elongation, seen from
+       earth_position, the result of earth.at(t)."""
+    if rotation is None:
+        rotation = _ecliptic_rotation(earth_position)
+    sun_lon = _ecliptic_longitude(sun.at(earth_position.t) - earth_position, rotation)
+    # The Sun's apparent longitude lags the geometric one by the constant of
+    # aberration (Meeus, Astronomical Algorithms, ch. 25)
+    return sun_lon - SUN_ABERRATION_DEG
+
+def _moon_longitude(earth_position, moon, rotation=None):
+    """Moon's geometric ecliptic longitude (of date), seen from earth_position,
+       the result of earth.at(t)."""
+    if rotation is None:
+        rotation = _ecliptic_rotation(earth_position)
+    return _ecliptic_longitude(moon.at(earth_position.t) - earth_position, rotation)
+
+def _longitude_fit(longitude, jd0, jd1, num_points=13, degree=8):
+    """Samples longitude(jd) (degrees, vectorized over jd) at num_points instants
+       spanning [jd0, jd1] in one call and returns a numpy Chebyshev series fitted
+       to it. The samples are unwrapped, so the fit can run past 360°; wrap its
+       values again where that matters. Over a few weeks the Sun's longitude is
+       smooth enough for the fit to stay well within an arcsecond."""
+    jd = np.linspace(jd0, jd1, num_points)
+    return np.polynomial.Chebyshev.fit(jd, np.unwrap(longitude(jd), period=360), degree)
+
+def _first_crossing_of_180(values):
+    """Returns the first index i where the elongation goes from <180 to >=180
+       between values[i] and values[i + 1], or None if it never does."""
+    crossings = np.flatnonzero((values[:-1] < 180) & (values[1:] >= 180))
+    if len(crossings) == 0:
+        return None
+    return crossings[0]
+
+def paschal_full_moon_jd(jd_after):
+    """Returns the Julian date (TT) of the first full moon after jd_after, e.g. the
+       vernal equinox, using the truncated lunar phase series of Meeus,
+       Astronomical Algorithms, ch. 49. Much cheaper than the JPL ephemeris, but
+       only checked against it for the years of de440.bsp (1549-2650).
+       jd_after may also be a NumPy array."""
+    jd_after = np.asarray(jd_after, dtype=float)
+    # Mean full moons just before and after jd_after; the true full moon can
+    # differ from the mean one by more than half a day, so try both neighbours too
+    k = np.floor((jd_after - 2451550.09766) / 29.530588861) + 0.5
+    k = k[..., np.newaxis] + np.array([-1.0, 0.0, 1.0, 2.0])
+    T = k / 1236.85
+
+    jde = (2451550.09766 + 29.530588861 * k + 0.00015437 * T**2
+           - 0.000000150 * T**3 + 0.00000000073 * T**4)
+    E = 1 - 0.002516 * T - 0.0000074 * T**2
+    M = np.radians(2.5534 + 29.10535670 * k - 0.0000014 * T**2 - 0.00000011 * T**3)
+    Mp = np.radians(201.5643 + 385.81693528 * k + 0.0107582 * T**2
+                    + 0.00001238 * T**3 - 0.000000058 * T**4)
+    F = np.radians(160.7108 + 390.67050284 * k - 0.0016118 * T**2
+                   - 0.00000227 * T**3 + 0.000000011 * T**4)
+    Om = np.radians(124.7746 - 1.56375588 * k + 0.0020672 * T**2 + 0.00000215 * T**3)
+
+    # Periodic corrections for the full moon (Meeus, p. 351)
+    jde += (-0.40614 * np.sin(Mp)
+            + 0.17302 * E * np.sin(M)
+            + 0.01614 * np.sin(2 * Mp)
+            + 0.01043 * np.sin(2 * F)
+            + 0.00734 * E * np.sin(Mp - M)
+            - 0.00515 * E * np.sin(Mp + M)
+            + 0.00209 * E**2 * np.sin(2 * M)
+            - 0.00111 * np.sin(Mp - 2 * F)
+            - 0.00057 * np.sin(Mp + 2 * F)
+            + 0.00056 * E * np.sin(2 * Mp + M)
+            - 0.00042 * np.sin(3 * Mp)
+            + 0.00042 * E * np.sin(M + 2 * F)
+            + 0.00038 * E * np.sin(M - 2 * F)
+            - 0.00024 * E * np.sin(2 * Mp - M)
+            - 0.00017 * np.sin(Om)
+            - 0.00007 * np.sin(Mp + 2 * M)
+            + 0.00004 * np.sin(2 * Mp - 2 * F)
+            + 0.00004 * np.sin(3 * M)
+            + 0.00003 * np.sin(Mp + M - 2 * F)
+            + 0.00003 * np.sin(2 * Mp + 2 * F)
+            - 0.00003 * np.sin(Mp + M + 2 * F)
+            + 0.00003 * np.sin(Mp - M + 2 * F)
+            - 0.00002 * np.sin(Mp - M - 2 * F)
+            - 0.00002 * np.sin(3 * Mp + M)
+            + 0.00002 * np.sin(4 * Mp))
+
+    # Additional corrections for all phases (Meeus, p. 352)
+    A = np.radians([
+        299.77 + 0.107408 * k - 0.009173 * T**2,
+        251.88 + 0.016321 * k,
+        251.83 + 26.651886 * k,
+        349.42 + 36.412478 * k,
+        84.66 + 18.206239 * k,
+        141.74 + 53.303771 * k,
+        207.14 + 2.453732 * k,
+        154.84 + 7.306860 * k,
+        34.52 + 27.261239 * k,
+        207.19 + 0.121824 * k,
+        291.34 + 1.844379 * k,
+        161.72 + 24.198154 * k,
+        239.56 + 25.513099 * k,
+        331.55 + 3.592518 * k,
+    ])
+    coefficients = np.array([0.000325, 0.000165, 0.000164, 0.000126, 0.000110,
+                             0.000062, 0.000060, 0.000056, 0.000047, 0.000042,
+                             0.000040, 0.000037, 0.000035, 0.000023])
+    jde += np.tensordot(coefficients, np.sin(A), axes=1)
+
+    # The candidates are in increasing order: take the first one after jd_after
+    first = np.argmax(jde > jd_after[..., np.newaxis], axis=-1)
+    return np.take_along_axis(jde, first[..., np.newaxis], axis=-1)[..., 0]
+
+def get_first_full_moon_after(time_after, ts=None, eph=None, window_days=30, high_precision=False):
     """Returns a SkyField Time Object with the instant of the 
        first full moon after a given Skyfield Time object (time_after).
+       For 1549 <= year <= 2650, the years of de440.bsp, the full moon comes from
+       Meeus's lunar phase series (paschal_full_moon_jd) by default. Outside
+       them, with high_precision=True, or when eph is given, the ephemeris is
+       searched instead.
+       ts and eph default to the shared timescale and the ephemeris covering time_after.
        If no moon found, returns None."""
+    if ts is None:
+        ts = get_timescale()
     jd0 = time_after.tt
     jd1 = jd0 + window_days
-    num_steps = int((jd1 - jd0) * 24) + 1  
-    times = np.linspace(jd0, jd1, num_steps)
-    values = [elongation_from_sun(ts, eph, jd) for jd in times]  # convert MJD to JD
-
-    # Now look for where elongation crosses from <180 to >=180
-    for i in range(len(values) - 1):
-        if values[i] < 180 <= values[i + 1]:
-            # Bracketed the full moon! Now root-find for elongation-180=0
-            def elong_minus_180(jd):
-                elong = elongation_from_sun(ts, eph, jd)
-                return elong - 180
-            
-            fm_jd = brentq(elong_minus_180, times[i], times[i + 1], xtol=1e-9)
-            fm_time = ts.tt(jd=fm_jd)
-            return fm_time
-    return None
+    year = time_after.tt_calendar()[0]
+
+    if eph is None and not high_precision and in_de440_years(year):
+        fm_jd = float(paschal_full_moon_jd(jd0))
+        if fm_jd > jd1:
+            return None
+        return ts.tt(jd=fm_jd)
+
+    if eph is None:
+        eph = load_ephemeris_for_year(year)
+    earth, sun, moon = eph['earth'], eph['sun'], eph['moon']
+
+    # The Sun is sampled once over the whole window and read from a fit after that
+    sun_longitude = _longitude_fit(lambda jd: _sun_longitude(earth.at(ts.tt(jd=jd)), sun), jd0, jd1)
+
+    # The callbacks below bind what they use as defaults, which are fast locals
+    def elongation(jd, _ts=ts, _earth=earth, _moon=moon, _fit=sun_longitude):
+        return (_moon_longitude(_earth.at(_ts.tt(jd=jd)), _moon) - _fit(jd)) % 360
+
+    # Coarse pass: one sample per day, evaluated in one batched Skyfield call
+    times = np.linspace(jd0, jd1, int(jd1 - jd0) + 1)
+    i = _first_crossing_of_180(elongation(times))
+    if i is None:
+        return None
+
+    # Fine pass: 3-hour samples across the bracketing day
+    times = np.linspace(times[i], times[i + 1], 9)
+    i = _first_crossing_of_180(elongation(times))
+    if i is None:
+        return None
+
+    # Bracketed the full moon! Now root-find for elongation-180=0.
+    def elong_minus_180(jd, _elongation=elongation):
+        return _elongation(jd) - 180
+
+    fm_jd = brentq(elong_minus_180, times[i], times[i + 1], xtol=ROOT_TOL_DAYS)
+    fm_time = ts.tt(jd=fm_jd)
+    return fm_time
+
+def mean_solar_time_from_datetime(dt_utc, longitude_deg):
+    """Converts a UTC datetime to mean solar time at given longitude (in degrees east).
 
-def mean_solar_time_utc(time, longitude_deg):
-    """Converts a Skyfield Time Object or UTC datetime to mean solar time at given longitude (in degrees east).
-    
     Args:
-        time: Skyfield Time object (or a Python datetime in UTC)
+        dt_utc: Python datetime in UTC
         longitude_deg: Longitude in degrees east (positive east, negative west)
     Returns:
         Python datetime object in local mean solar time.
     """
-    # Skyfield Time: get UTC datetime
-    if hasattr(time, 'utc_datetime'):
-        # Skyfield Time object
-        dt_utc = time.utc_datetime()
-    else:
-        dt_utc = time  # Assume it's already a datetime in UTC
-
     # Offset in minutes: 4 min per degree east
     offset_minutes = longitude_deg * 4
     # Compute mean solar time
     mst = dt_utc + datetime.timedelta(minutes=offset_minutes)
     return mst
 
+def mean_solar_time_from_skyfield(t, longitude_deg):
+    """Converts a Skyfield Time Object to mean solar time at given longitude (in degrees east).
+    Returns a Python datetime object in local mean solar time."""
+    return mean_solar_time_from_datetime(t.utc_datetime(), longitude_deg)
+
+def mean_solar_time_utc(time, longitude_deg):
+    """Converts a Skyfield Time Object or UTC datetime to mean solar time at given longitude (in degrees east).
+    Callers that know which of the two they hold can call mean_solar_time_from_skyfield
+    or mean_solar_time_from_datetime directly.
+    
+    Args:
+        time: Skyfield Time object (or a Python datetime in UTC)
+        longitude_deg: Longitude in degrees east (positive east, negative west)
+    Returns:
+        Python datetime object in local mean solar time.
+    """
+    if isinstance(time, Time):
+        return mean_solar_time_from_skyfield(time, longitude_deg)
+    return mean_solar_time_from_datetime(time, longitude_deg)
+
 def next_sunday_after_mean_solar_time(time):
     """
     Returns the month and day of the next Sunday after a Skyfield Time Object (or a Python datetime in UTC)
     """
 
     # Skyfield Time: get UTC datetime
-    if hasattr(time, 'utc_datetime'):
-        # Skyfield Time object
+    if isinstance(time, Time):
         dt = time.utc_datetime()
     else:
         dt = time  # Assume it's already a datetime in UTC
 
-    # weekday(): Monday=0 ... Sunday=6
-    days_until_sunday = (6 - dt.weekday()) % 7
-    if days_until_sunday == 0:
-        days_until_sunday = 7  # If already Sunday, go to next Sunday
-    next_sunday = dt + datetime.timedelta(days=days_until_sunday)
-    return next_sunday.date().strftime("%B %d")
+    # Ordinal 1 is Monday, January 1 of year 1, so ordinal % 7 == 0 on a Sunday.
+    # Step to the next Sunday; if already Sunday, go to next Sunday
+    ordinal = dt.toordinal()
+    next_sunday = datetime.date.fromordinal(ordinal + 7 - ordinal % 7)
+    return f"{_MONTHS[next_sunday.month - 1]} {next_sunday.day:02d}"
 
 def main():
     import sys
@@ -133,21 +348,18 @@ def main():
         year = 2025
 
     longitude = 35.2298  # Jerusalem longitude in degrees East
-    ts = load.timescale()
-    eph = load_ephemeris_for_year(year)
-
-    ve_time = vernal_equinox(ts, eph, year)
+    ve_time = vernal_equinox(year)
     print("Vernal Equinox (UTC):", ve_time.utc_datetime().strftime('%Y-%m-%d %H:%M:%S'))
-    ve_mst = mean_solar_time_utc(ve_time, longitude)
+    ve_mst = mean_solar_time_from_skyfield(ve_time, longitude)
     print("Vernal Equinox (solar time at Jerusalem):", ve_mst.strftime('%Y-%m-%d %H:%M:%S'))
 
-    full_moon = get_first_full_moon_after(ts, eph, ve_time)
+    full_moon = get_first_full_moon_after(ve_time)
     if full_moon is None:
         print("Error: a full moon was not found. Exiting.")
         sys.exit(1)
 
     print("Paschal full moon (UTC):", full_moon.utc_datetime().strftime('%Y-%m-%d %H:%M:%S'))
-    full_moon_mst = mean_solar_time_utc(full_moon, longitude)
+    full_moon_mst = mean_solar_time_from_skyfield(full_moon, longitude)
     print("Paschal full moon (solar time at Jerusalem):", full_moon_mst.strftime('%Y-%m-%d %H:%M:%S'))
 
     next_sunday = next_sunday_after_mean_solar_time(full_moon_mst)
@@ -1,105 +1,57 @@
 import datetime
 import csv
+import itertools
 
-from skyfield.api import load
-from scipy.optimize import brentq
+from skyfield.timelib import Time
 import numpy as np
-import datetime
-
-def load_ephemeris_for_year(year):
-    """Load de440.bsp for 1549 <= year <= 2650, otherwise load de406.bsp."""
-    if 1549 <= year <= 2650:
-        eph = load('de440.bsp')
-    else:
-        eph = load('de406.bsp')
-    return eph
 
-def vernal_equinox(ts, eph, year):
-    """Returns a Skyfield Time Object with the instant of the vernal equinox for year"""
+# The astronomy is shared with easter_calculator, so both scripts use one
+# timescale and one ephemeris cache
+from easter_calculator import (_MONTHS, ROOT_TOL_DAYS, get_timescale, in_de440_years,
+                               load_ephemeris_for_year, vernal_equinox, paschal_full_moon_jd,
+                               get_first_full_moon_after, mean_solar_time_from_skyfield)
+
+def vernal_equinoxes(years, ts=None, eph=None):
+    """Returns a Skyfield Time Object holding the instant of the vernal equinox of
+       every year in years. All years are solved together by a vectorized Newton
+       iteration, so each step is a single batched Skyfield call.
+       ts defaults to the shared timescale; eph defaults to the ephemeris covering
+       the first year, so pass one explicitly if years span more than one file.
+       Raises RuntimeError if the iteration does not converge."""
+    if ts is None:
+        ts = get_timescale()
+    if eph is None:
+        eph = load_ephemeris_for_year(years[0])
     earth = eph['earth']
     sun = eph['sun']
 
-    # Define a function returning Sun's apparent ecliptic longitude minus 0°
-    def sun_longitude_minus_zero(jd):
+    # Estimate: Vernal equinox occurs around March 20
+    jd = ts.utc(np.asarray(years), 3, 20).tt
+    for _ in range(10):
         t = ts.tt(jd=jd)
         astrometric = earth.at(t).observe(sun).apparent()
         lon = astrometric.ecliptic_latlon(epoch='date')[1]
-        # Wrap to [-180, 180) for robust root-finding
-        return ((lon.degrees + 180) % 360) - 180
-
-    # Estimate: Vernal equinox occurs around March 20
-    t0 = ts.utc(year, 3, 18)
-    t1 = ts.utc(year, 3, 22)
-    jd0 = t0.tt
-    jd1 = t1.tt
-
-    # Root-finding to solve sun_longitude_minus_zero(jd) == 0
-    eq_jd = brentq(sun_longitude_minus_zero, jd0, jd1)
-    eq_time = ts.tt(jd=eq_jd)
+        # Wrap to [-180, 180) and step back by the Sun's mean daily motion
+        step = (((lon.degrees + 180) % 360) - 180) / (360 / 365.2422)
+        jd = jd - step
+        if np.max(np.abs(step)) < ROOT_TOL_DAYS:
+            break
+    else:
+        raise RuntimeError("vernal_equinoxes did not converge")
 
-    # Return as a Skyfield Time object (can use eq_time.utc_datetime(), eq_time.utc_iso(), etc.)
-    return eq_time
+    return ts.tt(jd=jd)
 
-def elongation_from_sun(ts, eph, jd):
-    """Returns the Elongation of the moon from the sun in degrees at given Julian date jd."""
-    t = ts.tt(jd=jd)
-    earth = eph['earth']
-    sun = eph['sun']
-    moon = eph['moon']
-    astrometric_sun = earth.at(t).observe(sun).apparent()
-    astrometric_moon = earth.at(t).observe(moon).apparent()
-
-    # Use ecliptic longitude in true equinox of date
-    sun_lon = astrometric_sun.ecliptic_latlon(epoch='date')[1].degrees
-    moon_lon = astrometric_moon.ecliptic_latlon(epoch='date')[1].degrees
-
-    elong = (moon_lon - sun_lon) % 360
-    return elong
-
-def get_first_full_moon_after(ts, eph, time_after, window_days=30):
-    """Returns a SkyField Time Object with the instant of the 
-       first full moon after a given Skyfield Time object (time_after).
-       If no moon found, returns None."""
-    jd0 = time_after.tt
-    jd1 = jd0 + window_days
-    num_steps = int((jd1 - jd0) * 24) + 1  
-    times = np.linspace(jd0, jd1, num_steps)
-    values = [elongation_from_sun(ts, eph, jd) for jd in times]  # convert MJD to JD
-
-    # Now look for where elongation crosses from <180 to >=180
-    for i in range(len(values) - 1):
-        if values[i] < 180 <= values[i + 1]:
-            # Bracketed the full moon! Now root-find for elongation-180=0
-            def elong_minus_180(jd):
-                elong = elongation_from_sun(ts, eph, jd)
-                return elong - 180
-            
-            fm_jd = brentq(elong_minus_180, times[i], times[i + 1], xtol=1e-9)
-            fm_time = ts.tt(jd=fm_jd)
-            return fm_time
-    return None
-
-def mean_solar_time_utc(time, longitude_deg):
-    """Converts a Skyfield Time Object or UTC datetime to mean solar time at given longitude (in degrees east).
-    
-    Args:
-        time: Skyfield Time object (or a Python datetime in UTC)
-        longitude_deg: Longitude in degrees east (positive east, negative west)
-    Returns:
-        Python datetime object in local mean solar time.
+def format_mean_solar_times(t, longitude_deg):
+    """Formats every instant of a Skyfield Time array as mean solar time at given
+    longitude (in degrees east), e.g. "March 21 05:35". The calendar conversion runs
+    once over the whole array instead of one datetime and strftime per instant.
+    A single Time gives a list of one string.
     """
-    # Skyfield Time: get UTC datetime
-    if hasattr(time, 'utc_datetime'):
-        # Skyfield Time object
-        dt_utc = time.utc_datetime()
-    else:
-        dt_utc = time  # Assume it's already a datetime in UTC
-
-    # Offset in minutes: 4 min per degree east
-    offset_minutes = longitude_deg * 4
-    # Compute mean solar time
-    mst = dt_utc + datetime.timedelta(minutes=offset_minutes)
-    return mst
+    # 4 min per degree east, i.e. 1/360 of a day per degree
+    mst = t + longitude_deg / 360
+    # Skyfield returns the calendar fields as floats, or float arrays for a Time array
+    month, day, hour, minute = (np.atleast_1d(field).astype(int) for field in mst.utc[1:5])
+    return [f"{_MONTHS[mo - 1]} {d} {h:02d}:{mi:02d}" for mo, d, h, mi in zip(month, day, hour, minute)]
 
 def next_sunday_after_mean_solar_time(time):
     """
@@ -107,22 +59,21 @@ def next_sunday_after_mean_solar_time(time):
     """
 
     # Skyfield Time: get UTC datetime
-    if hasattr(time, 'utc_datetime'):
-        # Skyfield Time object
+    if isinstance(time, Time):
         dt = time.utc_datetime()
     else:
         dt = time  # Assume it's already a datetime in UTC
 
-    # weekday(): Monday=0 ... Sunday=6
-    days_until_sunday = (6 - dt.weekday()) % 7
-    if days_until_sunday == 0:
-        days_until_sunday = 7  # If already Sunday, go to next Sunday
-    next_sunday = dt + datetime.timedelta(days=days_until_sunday)
-    return next_sunday.date().strftime("%B %-d")
+    # Ordinal 1 is Monday, January 1 of year 1, so ordinal % 7 == 0 on a Sunday.
+    # Step to the next Sunday; if already Sunday, go to next Sunday
+    ordinal = dt.toordinal()
+    next_sunday = datetime.date.fromordinal(ordinal + 7 - ordinal % 7)
+    return f"{_MONTHS[next_sunday.month - 1]} {next_sunday.day}"
 
-def julian_easter(year):
+def julian_easter_month_day(year):
     """
     Use the Gaussian formulae to calculate Easter on the Alexandria Paschallion
+    Returns (month, day) as integers
     Warning: because of the hardcoded 13 below, only valid for 1900-2099
     """
 
@@ -134,21 +85,22 @@ def julian_easter(year):
     f = int((d + e + 114) / 31) #Month of pascha e.g. march=3
     g = ((d + e + 114) % 31) + 1 #Day of pascha in the month
     day = g + 13 # assume the Julian calendar offset is 13 days
-    month = "March"
+    month = 3
     if (day >= 35 and f == 3):
-        month = "April"
+        month = 4
         day  -= 31
     elif (day >= 31 and f == 4):
-        month = "May"
+        month = 5
         day  -= 30
     else:
-        month = "April"
-    
-    return f"{month} {day}"
+        month = 4
 
-def gregorian_easter(year):
+    return month, day
+
+def gregorian_easter_month_day(year):
     """
     Formula for computing Gregorian Easter due to Meeus, Astronomical Algorithms
+    Returns (month, day) as integers
     """
     a = year % 19
     b = int(year / 100)
@@ -164,32 +116,120 @@ def gregorian_easter(year):
     m = int((a + 11 * h + 22 * l) / 451)
     n = int((h + l - 7 * m + 114) / 31)
     p = (h + l - 7 * m + 114) % 31
-    month = "March" if n == 3 else "April"
-    return f"{month} {p + 1}"
+    return n, p + 1
+
+def julian_easter(year):
+    """
+    Julian Easter (Alexandria Paschallion) formatted as e.g. "April 20"
+    Warning: only valid for 1900-2099, see julian_easter_month_day
+    """
+    month, day = julian_easter_month_day(year)
+    return f"{_MONTHS[month - 1]} {day}"
+
+def gregorian_easter(year):
+    """
+    Gregorian Easter formatted as e.g. "April 20"
+    """
+    month, day = gregorian_easter_month_day(year)
+    return f"{_MONTHS[month - 1]} {day}"
+
+def julian_easter_vec(years):
+    """
+    Vectorized julian_easter: takes an array of years and returns two integer
+    arrays (month, day), e.g. (4, 20) for April 20
+    """
+    years = np.asarray(years)
+    a = years % 4
+    b = years % 7
+    c = years % 19
+    d = (19 * c + 15) % 30
+    e = (2 * a + 4 * b - d + 34) % 7
+    f = (d + e + 114) // 31 #Month of pascha e.g. march=3
+    g = ((d + e + 114) % 31) + 1 #Day of pascha in the month
+    day = g + 13 # assume the Julian calendar offset is 13 days
+    into_april = (day >= 35) & (f == 3)
+    into_may = (day >= 31) & (f == 4)
+    month = np.where(into_may, 5, 4)
+    day = np.where(into_april, day - 31, np.where(into_may, day - 30, day))
+    return month, day
+
+def gregorian_easter_vec(years):
+    """
+    Vectorized gregorian_easter: takes an array of years and returns two integer
+    arrays (month, day), e.g. (4, 20) for April 20
+    """
+    years = np.asarray(years)
+    a = years % 19
+    b = years // 100
+    c = years % 100
+    d = b // 4
+    e = b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i = c // 4
+    k = c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    n = (h + l - 7 * m + 114) // 31
+    p = (h + l - 7 * m + 114) % 31
+    return n, p + 1
+
+def compute_rows(years, longitude):
+    """
+    Computes the table rows for a run of consecutive years, or returns None if
+    a full moon was not found for one of them.
+    """
+    ts = get_timescale()
+
+    # Both calendar Easters for the whole run in one NumPy pass
+    g_months, g_days = gregorian_easter_vec(years)
+    j_months, j_days = julian_easter_vec(years)
+
+    # Equinoxes for the whole run at once, one batch per ephemeris file
+    ve_jd = np.concatenate([vernal_equinoxes(list(group), ts=ts, eph=eph).tt
+                            for eph, group in itertools.groupby(years, key=load_ephemeris_for_year)])
+    ve_times = ts.tt(jd=ve_jd)
+    # Cross-check the batched Newton solve against the brentq solver easter_calculator uses
+    if abs(ve_jd[0] - vernal_equinox(years[0], ts=ts).tt) > 1 / 86400:
+        raise RuntimeError(f"vernal_equinoxes and vernal_equinox disagree for {years[0]}")
+
+    # Full moons from the Meeus series in one NumPy pass; years outside de440.bsp
+    # are searched in the ephemeris one at a time, as get_first_full_moon_after does
+    fm_jd = paschal_full_moon_jd(ve_jd)
+    if np.any(fm_jd > ve_jd + 30):  # the window of get_first_full_moon_after
+        return None
+    for i in np.flatnonzero(~in_de440_years(np.asarray(years))):
+        full_moon = get_first_full_moon_after(ve_times[i], ts=ts)
+        if full_moon is None:
+            return None
+        fm_jd[i] = full_moon.tt
+    full_moons = ts.tt(jd=fm_jd)
+
+    next_sundays = [next_sunday_after_mean_solar_time(mean_solar_time_from_skyfield(full_moon, longitude))
+                    for full_moon in full_moons]
+
+    # Every column is formatted in one pass over its whole array
+    ve_strs = format_mean_solar_times(ve_times, longitude)
+    fm_strs = format_mean_solar_times(full_moons, longitude)
+    g_easters = [f"{_MONTHS[month - 1]} {day}" for month, day in zip(g_months, g_days)]
+    j_easters = [f"{_MONTHS[month - 1]} {day}" for month, day in zip(j_months, j_days)]
+    return list(zip(years, ve_strs, fm_strs, next_sundays, g_easters, j_easters))
 
 def main():
     import sys
 
     longitude = 35.2298  # degrees East
-    ts = load.timescale()
+
+    rows = compute_rows(range(2025, 2076, 1), longitude)
+    if rows is None:
+        print("Error: a full moon was not found. Exiting.")
+        sys.exit()
 
     with open('table.csv', mode='w', newline='') as file:
         writer = csv.writer(file)
         writer.writerow(['Year', 'Vernal Equinox', 'Paschal Moon', 'Astronomical Easter', 'Gregorian Easter', 'Julian Easter'])
-
-        for year in range(2025, 2076, 1):
-            eph = load_ephemeris_for_year(year)
-
-            ve_time = vernal_equinox(ts, eph, year)
-            ve_mst = mean_solar_time_utc(ve_time, longitude)
-            full_moon = get_first_full_moon_after(ts, eph, ve_time)
-            if full_moon is None:
-                print("Error: a full moon was not found. Exiting.")
-                sys.exit()
-
-            full_moon_mst = mean_solar_time_utc(full_moon, longitude)
-            next_sunday = next_sunday_after_mean_solar_time(full_moon_mst)
-            writer.writerow([year, ve_mst.strftime('%B %-d %H:%M'), full_moon_mst.strftime('%B %-d %H:%M'), next_sunday, gregorian_easter(year), julian_easter(year)])
+        writer.writerows(rows)
 
 if __name__ == "__main__":
     main()